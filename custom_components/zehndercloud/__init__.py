@@ -1,40 +1,66 @@
 """The Zehnder Cloud integration."""
 from __future__ import annotations
 
+import asyncio
+from collections.abc import Awaitable, Callable
 from datetime import timedelta
 import logging
+from time import monotonic, time
+from typing import Any, TypeVar
 
-import async_timeout
-from pyzehndercloud import AuthError, DeviceDetails, DeviceState, ZehnderCloud
+import aiohttp
+from aiohttp.hdrs import USER_AGENT
+from pyzehndercloud import AuthError, DeviceDetails, ZehnderCloud
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import Platform
-from homeassistant.core import HomeAssistant
-from homeassistant.exceptions import ConfigEntryAuthFailed
-from homeassistant.helpers import aiohttp_client, config_entry_oauth2_flow
+from homeassistant.const import (
+    EVENT_HOMEASSISTANT_CLOSE,
+    EVENT_HOMEASSISTANT_STOP,
+    Platform,
+)
+from homeassistant.core import Event, HomeAssistant
+from homeassistant.exceptions import ConfigEntryAuthFailed, ConfigEntryNotReady
+from homeassistant.helpers import config_entry_oauth2_flow
+from homeassistant.helpers.aiohttp_client import SERVER_SOFTWARE
 from homeassistant.helpers.entity import DeviceInfo
+from homeassistant.helpers.json import json_dumps
 from homeassistant.helpers.update_coordinator import (
     CoordinatorEntity,
     DataUpdateCoordinator,
     UpdateFailed,
 )
+from homeassistant.util.ssl import get_default_context
 
 from . import api, config_flow
-from .const import DOMAIN
+from .const import CONF_DEVICES, CONF_DISCOVERED_AT, DOMAIN
 from .oauth_impl import ZehnderCloudOauth2Implementation
 
 PLATFORMS: list[Platform] = [Platform.SENSOR, Platform.BINARY_SENSOR, Platform.FAN]
 DEFAULT_UPDATE_INTERVAL = timedelta(seconds=30)
+DETAILS_UPDATE_INTERVAL = timedelta(minutes=10)
+DEVICES_CACHE_DURATION = timedelta(hours=24)
 
 _LOGGER = logging.getLogger(__name__)
 
+_T = TypeVar("_T")
+
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Zehnder Cloud from a config entry."""
-    config_flow.ZehnderCloudControlFlowHandler.async_register_implementation(
-        hass,
-        ZehnderCloudOauth2Implementation(hass),
+    # A config flow registers an implementation bound to its own code verifier,
+    # replace that one, but keep one registered by an earlier setup.
+    implementations = await config_entry_oauth2_flow.async_get_implementations(
+        hass, DOMAIN
     )
+    current_implementation = implementations.get(DOMAIN)
+    if (
+        not isinstance(current_implementation, ZehnderCloudOauth2Implementation)
+        or current_implementation.auth_code_verifier
+    ):
+        config_flow.ZehnderCloudControlFlowHandler.async_register_implementation(
+            hass,
+            ZehnderCloudOauth2Implementation(hass),
+        )
 
     implementation = (
         await config_entry_oauth2_flow.async_get_config_entry_implementation(
@@ -42,40 +68,151 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         )
     )
 
-    web_session = aiohttp_client.async_get_clientsession(hass)
+    # Use a dedicated session that keeps connections to the API alive between
+    # polls, so that every update does not pay for a new TLS handshake.
+    web_session = aiohttp.ClientSession(
+        connector=aiohttp.TCPConnector(
+            limit=20,
+            limit_per_host=8,
+            keepalive_timeout=75,
+            ttl_dns_cache=300,
+            ssl=get_default_context(),
+        ),
+        headers={USER_AGENT: SERVER_SOFTWARE},
+        json_serialize=json_dumps,
+        response_class=api.ZehnderCloudClientResponse,
+    )
+    entry.async_on_unload(web_session.close)
+
+    async def _async_close_session(event: Event) -> None:
+        """Close the session when Home Assistant closes."""
+        await web_session.close()
+
+    # Config entries are not unloaded at shutdown, so close it on that event
+    # as well, like Home Assistant does for its own sessions.
+    entry.async_on_unload(
+        hass.bus.async_listen_once(EVENT_HOMEASSISTANT_CLOSE, _async_close_session)
+    )
+
     oauth_session = config_entry_oauth2_flow.OAuth2Session(hass, entry, implementation)
     auth = api.AsyncConfigEntryAuth(web_session, oauth_session)
 
-    try:
-        client = ZehnderCloud(web_session, auth)
-        devices = await client.get_devices()
-    except AuthError as ex:
-        raise ConfigEntryAuthFailed(f"Credentials expired for Zehnder Cloud") from ex
+    client = ZehnderCloud(web_session, auth)
+
+    # Reuse the devices found during a previous setup, and look for changes in
+    # the background instead of waiting for them.
+    devices = entry.data.get(CONF_DEVICES)
+    stored_devices = bool(devices) and (
+        time() - entry.data.get(CONF_DISCOVERED_AT, 0)
+        < DEVICES_CACHE_DURATION.total_seconds()
+    )
+    refresh_task: asyncio.Task | None = None
+    if stored_devices:
+        refresh_task = entry.async_create_background_task(
+            hass,
+            _async_refresh_devices(hass, entry, client),
+            "zehndercloud refresh devices",
+        )
+    else:
+        devices = await _async_setup_discover_devices(hass, entry, client)
 
-    # Create a coordinator for every device we poll.
-    coordinators = []
-    for device_id in devices:
+    # A single coordinator polls all devices in one batched update.
+    coordinator = ZehnderCloudUpdateCoordinator(
+        hass=hass, client=client, device_ids=list(devices)
+    )
+    try:
+        await coordinator.async_config_entry_first_refresh()
+    except ConfigEntryNotReady:
+        if refresh_task is None:
+            raise
+
+        # The stored devices may be outdated, discover them again before
+        # giving up, so a retry does not reuse the same list. The refresh in
+        # the background is cancelled to not request the devices twice.
+        refresh_task.cancel()
+        devices = await _async_setup_discover_devices(hass, entry, client)
         coordinator = ZehnderCloudUpdateCoordinator(
-            hass=hass, client=client, device_id=device_id
+            hass=hass, client=client, device_ids=devices
         )
         await coordinator.async_config_entry_first_refresh()
-        coordinators.append(coordinator)
 
-    hass.data.setdefault(DOMAIN, {})[entry.entry_id] = coordinators
+    hass.data.setdefault(DOMAIN, {})[entry.entry_id] = coordinator
+
+    async def _async_shutdown(event: Event) -> None:
+        """Stop polling when Home Assistant stops."""
+        await coordinator.async_shutdown()
+
+    entry.async_on_unload(
+        hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, _async_shutdown)
+    )
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
     return True
 
 
+async def _async_discover_devices(
+    hass: HomeAssistant, entry: ConfigEntry, client: ZehnderCloud
+) -> list[int]:
+    """Fetch the devices of the account and store them in the config entry."""
+    devices = list(await client.get_devices())
+    hass.config_entries.async_update_entry(
+        entry,
+        data={**entry.data, CONF_DEVICES: devices, CONF_DISCOVERED_AT: time()},
+    )
+    return devices
+
+
+async def _async_setup_discover_devices(
+    hass: HomeAssistant, entry: ConfigEntry, client: ZehnderCloud
+) -> list[int]:
+    """Discover the devices during setup."""
+    try:
+        return await _async_discover_devices(hass, entry, client)
+    except AuthError as ex:
+        raise ConfigEntryAuthFailed(f"Credentials expired for Zehnder Cloud") from ex
+    except Exception as ex:
+        raise ConfigEntryNotReady(f"Error communicating with API: {ex}") from ex
+
+
+async def _async_refresh_devices(
+    hass: HomeAssistant, entry: ConfigEntry, client: ZehnderCloud
+) -> None:
+    """Refresh the stored devices, changes are picked up on the next setup."""
+    try:
+        await _async_discover_devices(hass, entry, client)
+    except Exception as ex:
+        _LOGGER.warning("Unable to refresh the Zehnder Cloud devices: %s", ex)
+
+
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
     if unload_ok := await hass.config_entries.async_unload_platforms(entry, PLATFORMS):
+        coordinator: ZehnderCloudUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
+        await coordinator.async_shutdown()
         hass.data[DOMAIN].pop(entry.entry_id)
 
     return unload_ok
 
 
+class ZehnderCloudValueMap(dict):
+    """Map of the values of a device, looked up once per update.
+
+    pyzehndercloud resolves every value by scanning the payload, so the
+    result of each lookup is memoized for the lifetime of the update.
+    """
+
+    def __init__(self, lookup: Callable[[str], Any]) -> None:
+        """Initialize the map with the function used to look up a value."""
+        super().__init__()
+        self._lookup = lookup
+
+    def __missing__(self, key: str) -> Any:
+        """Look up and remember a value that was not read yet."""
+        value = self[key] = self._lookup(key)
+        return value
+
+
 class ZehnderCloudUpdateCoordinator(DataUpdateCoordinator):
     """Class to manage fetching Zehnder Cloud Device data."""
 
@@ -83,76 +220,213 @@ class ZehnderCloudUpdateCoordinator(DataUpdateCoordinator):
         self,
         hass: HomeAssistant,
         client: ZehnderCloud,
-        device_id: int,
+        device_ids: list[int],
     ) -> None:
         """Initialize."""
         self._client = client
-        self._device_id = device_id
+        self._device_ids = device_ids
+        self._details: dict[int, dict] = {}
+        self._details_fetched_at = 0.0
+        self._failed_devices: set[int] = set()
 
         super().__init__(
-            hass, _LOGGER, name=DOMAIN, update_interval=DEFAULT_UPDATE_INTERVAL
+            hass,
+            _LOGGER,
+            name=DOMAIN,
+            update_interval=DEFAULT_UPDATE_INTERVAL,
+            always_update=False,
         )
 
-    async def _async_update_data(self) -> dict:
+    async def _async_update_data(self) -> dict[int, dict]:
         """Update data via library."""
-        try:
-            async with async_timeout.timeout(10):
-                state = await self._client.get_device_state(self._device_id)
-                _LOGGER.debug("State for device %s: %s", self._device_id, state)
-
-            async with async_timeout.timeout(10):
-                details = await self._client.get_device_details(self._device_id)
-                _LOGGER.debug("Details for device %s: %s", self._device_id, details)
+        # The details of a device rarely change, so they are fetched on a
+        # slower interval than the state and reused in between.
+        fetch_all_details = (
+            monotonic() - self._details_fetched_at
+            > DETAILS_UPDATE_INTERVAL.total_seconds()
+        )
+        details_ids = [
+            d for d in self._device_ids if fetch_all_details or d not in self._details
+        ]
 
-        except AuthError as ex:
+        try:
+            async with asyncio.TaskGroup() as task_group:
+                state_tasks = [
+                    task_group.create_task(
+                        self._async_fetch(self._client.get_device_state(d))
+                    )
+                    for d in self._device_ids
+                ]
+                details_tasks = [
+                    task_group.create_task(
+                        self._async_fetch(self._client.get_device_details(d))
+                    )
+                    for d in details_ids
+                ]
+
+        except* AuthError as ex:
             raise ConfigEntryAuthFailed(
                 f"Credentials expired for Zehnder Cloud"
-            ) from ex
-
+            ) from ex.exceptions[0]
+
+        for device_id, task in zip(details_ids, details_tasks):
+            details = task.result()
+            if isinstance(details, Exception):
+                # Previous details of the device, if any, are kept.
+                _LOGGER.debug("Details for device %s failed: %s", device_id, details)
+                continue
+
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug("Details for device %s: %s", device_id, details)
+
+            self._details[device_id] = {
+                "details": details,
+                "details_map": ZehnderCloudValueMap(details.property),
+            }
+        if fetch_all_details:
+            self._details_fetched_at = monotonic()
+
+        # A device that can't be updated is left out, which only makes the
+        # entities of that device unavailable.
+        data = {}
+        error: object = None
+        for device_id, task in zip(self._device_ids, state_tasks):
+            state = task.result()
+            if isinstance(state, Exception):
+                error = state
+                self._async_device_failed(device_id, error)
+                continue
+
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug("State for device %s: %s", device_id, state)
+
+            timestamp = state.data.get("timestamp")
+            if timestamp is None:
+                error = "Update from Zehnder Cloud did not contain data"
+                self._async_device_failed(device_id, error)
+                continue
+
+            if device_id not in self._details:
+                error = "Details of the device are not available"
+                self._async_device_failed(device_id, error)
+                continue
+
+            if device_id in self._failed_devices:
+                self._failed_devices.discard(device_id)
+                _LOGGER.info("Zehnder Cloud device %s is available again", device_id)
+
+            # Keep the previous data when there is no new sample, when nothing
+            # changed for any device the listeners are not called at all.
+            previous = self.data.get(device_id) if self.data else None
+            if (
+                previous is not None
+                and previous["state"].data.get("timestamp") == timestamp
+                and previous["details"] is self._details[device_id]["details"]
+            ):
+                data[device_id] = previous
+                continue
+
+            data[device_id] = {
+                "state": state,
+                "state_map": ZehnderCloudValueMap(state.value),
+                **self._details[device_id],
+            }
+
+        if self._device_ids and not data:
+            raise UpdateFailed(f"Error communicating with API: {error}")
+
+        return data
+
+    @staticmethod
+    async def _async_fetch(request: Awaitable[_T]) -> _T | Exception:
+        """Run a request for a single device and return its error on failure."""
+        # Each request has its own timeout rather than one for the whole
+        # update, so a slow device only fails itself and not the others.
+        try:
+            async with asyncio.timeout(10):
+                return await request
+        except AuthError:
+            raise
         except Exception as ex:
-            raise UpdateFailed(f"Error communicating with API: {ex}") from ex
-
-        if state.data.get("timestamp") is None:
-            raise UpdateFailed("Update from Zehnder Cloud did not contain data")
+            return ex
 
-        return {"state": state, "details": details}
+    def _async_device_failed(self, device_id: int, error: object) -> None:
+        """Log a device that could not be updated, once until it recovers."""
+        if device_id not in self._failed_devices:
+            self._failed_devices.add(device_id)
+            _LOGGER.warning(
+                "Unable to update Zehnder Cloud device %s: %s", device_id, error
+            )
 
     @property
     def client(self) -> ZehnderCloud:
         """Return the client."""
         return self._client
 
-    @property
-    def device_id(self) -> int:
-        """Return the device id."""
-        return self._device_id
+
+class ZehnderCloudEntity(CoordinatorEntity[ZehnderCloudUpdateCoordinator]):
+    """Base class for a Zehnder Cloud entity."""
+
+    # Platforms add all of their entities with a single async_add_entities()
+    # call and without update_before_add, since the coordinator has already
+    # done its first refresh before the platforms are set up.
+
+    # Only our own attributes, the _attr_* attributes are managed by Home
+    # Assistant's entity base classes.
+    __slots__ = ("_device_id", "_cached_device_info", "_cached_details")
+
+    def __init__(
+        self,
+        coordinator: ZehnderCloudUpdateCoordinator,
+        device_id: int,
+    ) -> None:
+        """Initialize a Zehnder Cloud entity."""
+        super().__init__(coordinator=coordinator)
+        self._device_id = device_id
+        self._cached_device_info: DeviceInfo | None = None
+        self._cached_details: DeviceDetails | None = None
 
     @property
-    def state(self) -> DeviceState:
-        """Return the state of the device."""
-        return self.data.get("state")
+    def available(self) -> bool:
+        """Return if the device was updated by the last refresh."""
+        return super().available and self._device_id in self.coordinator.data
 
     @property
-    def details(self) -> DeviceDetails:
+    def device_details(self) -> DeviceDetails:
         """Return the details of the device."""
-        return self.data.get("details")
+        return self.coordinator.data[self._device_id]["details"]
 
+    @property
+    def state_map(self) -> ZehnderCloudValueMap:
+        """Return the state values of the device."""
+        return self.coordinator.data[self._device_id]["state_map"]
 
-class ZehnderCloudEntity(CoordinatorEntity[ZehnderCloudUpdateCoordinator]):
-    """Base class for a Zehnder Cloud entity."""
+    @property
+    def details_map(self) -> ZehnderCloudValueMap:
+        """Return the detail properties of the device."""
+        return self.coordinator.data[self._device_id]["details_map"]
 
     @property
-    def device_info(self) -> DeviceInfo:
+    def device_info(self) -> DeviceInfo | None:
         """Return device information about this device."""
-        return DeviceInfo(
-            identifiers={(DOMAIN, self.coordinator.details.value("serialNumber"))},
-            name=self.coordinator.details.value("deviceType").get("name"),
-            manufacturer="Zehnder",
-            model=self.coordinator.details.value("deviceType").get("name"),
-            sw_version=self.coordinator.details.property("swVersion"),
-            hw_version=self.coordinator.details.property("hwVersion"),
-            configuration_url=f"https://my.zehnder-systems.com/customer/devices/{self.coordinator.device_id}",
-        )
+        if self._device_id not in self.coordinator.data:
+            return None
+
+        # The details object is only replaced when the details are fetched
+        # again, so it is rebuilt at most once per details refresh.
+        details = self.device_details
+        if details is not self._cached_details:
+            self._cached_device_info = DeviceInfo(
+                identifiers={(DOMAIN, details.value("serialNumber"))},
+                name=details.value("deviceType").get("name"),
+                manufacturer="Zehnder",
+                model=details.value("deviceType").get("name"),
+                sw_version=self.details_map["swVersion"],
+                hw_version=self.details_map["hwVersion"],
+                configuration_url=f"https://my.zehnder-systems.com/customer/devices/{self._device_id}",
+            )
+            self._cached_details = details
+        return self._cached_device_info
 
 # TODO: create sensors for this
 example = {
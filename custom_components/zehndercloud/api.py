@@ -1,10 +1,12 @@
 """API for Zehnder Cloud bound to Home Assistant OAuth."""
 import logging
+from typing import Any
 
-from aiohttp import ClientSession
+from aiohttp import ClientResponse, ClientSession
 import pyzehndercloud
 
 from homeassistant.helpers import config_entry_oauth2_flow
+from homeassistant.util.json import json_loads
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -27,3 +29,19 @@ class AsyncConfigEntryAuth(pyzehndercloud.AbstractAuth):
             await self._oauth_session.async_ensure_token_valid()
 
         return self._oauth_session.token["access_token"]
+
+
+class ZehnderCloudClientResponse(ClientResponse):
+    """Response that decodes JSON with Home Assistant's orjson based loads."""
+
+    async def json(
+        self,
+        *,
+        encoding: str | None = None,
+        loads: Any = json_loads,
+        content_type: str | None = "application/json",
+    ) -> Any:
+        """Read and decode the JSON body of the response."""
+        return await super().json(
+            encoding=encoding, loads=loads, content_type=content_type
+        )
@@ -3,7 +3,6 @@ from __future__ import annotations
 
 from collections.abc import Callable
 from dataclasses import dataclass
-from datetime import datetime
 import logging
 
 from homeassistant.components.binary_sensor import (
@@ -16,81 +15,73 @@ from homeassistant.helpers.entity import EntityCategory
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.typing import StateType
 
-from . import ZehnderCloudEntity, ZehnderCloudUpdateCoordinator
+from . import ZehnderCloudEntity, ZehnderCloudUpdateCoordinator, ZehnderCloudValueMap
 from .const import DOMAIN
 
 _LOGGER = logging.getLogger(__name__)
 
+# Values are reported as strings, e.g. "False", so bool() can't be used.
+_TRUTHY = frozenset({"true", "True", "1", True, 1})
 
-@dataclass
-class ZehnderCloudBinarySensorEntityDescriptionMixin:
-    """Mixin for required keys."""
 
-    value_fn: Callable[dict, datetime | StateType]
+def _as_bool(value: StateType) -> bool:
+    """Return whether a reported value is true."""
+    return value in _TRUTHY
 
 
-@dataclass
-class ZehnderCloudBinarySensorEntityDescription(
-    BinarySensorEntityDescription, ZehnderCloudBinarySensorEntityDescriptionMixin
-):
+@dataclass(frozen=True, kw_only=True)
+class ZehnderCloudBinarySensorEntityDescription(BinarySensorEntityDescription):
     """Describes Zehnder Cloud binary sensor entity."""
 
+    # Only needed when the state is not the value of `key` itself.
+    value_fn: Callable[[ZehnderCloudValueMap], bool | None] | None = None
+
 
 SENSORS: tuple[ZehnderCloudBinarySensorEntityDescription, ...] = (
     ZehnderCloudBinarySensorEntityDescription(
         key="awayEnabled",
         name="Away mode",
         entity_category=EntityCategory.DIAGNOSTIC,
-        value_fn=lambda coordinator: bool(coordinator.state.value("awayEnabled")),
     ),
     ZehnderCloudBinarySensorEntityDescription(
         key="manualMode",
         name="Manual Mode",
         entity_category=EntityCategory.DIAGNOSTIC,
-        value_fn=lambda coordinator: bool(coordinator.state.value("manualMode")),
     ),
     ZehnderCloudBinarySensorEntityDescription(
         key="boostTimerEnabled",
         name="Boost Timer Enabled",
         entity_category=EntityCategory.DIAGNOSTIC,
-        value_fn=lambda coordinator: bool(coordinator.state.value("boostTimerEnabled")),
     ),
     ZehnderCloudBinarySensorEntityDescription(
         key="coolingSeason",
         name="coolingSeason",
         entity_category=EntityCategory.DIAGNOSTIC,
         entity_registry_enabled_default=False,
-        value_fn=lambda coordinator: bool(coordinator.state.value("coolingSeason")),
     ),
     ZehnderCloudBinarySensorEntityDescription(
         key="heatingSeason",
         name="heatingSeason",
         entity_category=EntityCategory.DIAGNOSTIC,
         entity_registry_enabled_default=False,
-        value_fn=lambda coordinator: bool(coordinator.state.value("heatingSeason")),
     ),
     ZehnderCloudBinarySensorEntityDescription(
         key="hoodIsOn",
         name="hoodIsOn",
         entity_category=EntityCategory.DIAGNOSTIC,
         entity_registry_enabled_default=False,
-        value_fn=lambda coordinator: bool(coordinator.state.value("hoodIsOn")),
     ),
     ZehnderCloudBinarySensorEntityDescription(
         key="hoodPresence",
         name="hoodPresence",
         entity_category=EntityCategory.DIAGNOSTIC,
         entity_registry_enabled_default=False,
-        value_fn=lambda coordinator: bool(coordinator.state.value("hoodPresence")),
     ),
     ZehnderCloudBinarySensorEntityDescription(
         key="postHeaterPresence",
         name="postHeaterPresence",
         entity_category=EntityCategory.DIAGNOSTIC,
         entity_registry_enabled_default=False,
-        value_fn=lambda coordinator: bool(
-            coordinator.state.value("postHeaterPresence")
-        ),
     ),
 )
 
@@ -101,14 +92,14 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up Zehnder Cloud binary sensor based on a config entry."""
-    coordinators: list[ZehnderCloudUpdateCoordinator] = hass.data[DOMAIN][
-        entry.entry_id
-    ]
+    coordinator: ZehnderCloudUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
 
+    # Only devices updated by the first refresh, so that the entities are
+    # registered with their device.
     entities = [
-        ZehnderCloudBinarySensor(coordinator, description)
-        for description in SENSORS
-        for coordinator in coordinators
+        sensor_class(coordinator, device_id, description)
+        for description, sensor_class in _SENSOR_CLASSES
+        for device_id in coordinator.data
     ]
 
     async_add_entities(entities)
@@ -122,15 +113,42 @@ class ZehnderCloudBinarySensor(ZehnderCloudEntity, BinarySensorEntity):
     def __init__(
         self,
         coordinator: ZehnderCloudUpdateCoordinator,
+        device_id: int,
         description: ZehnderCloudBinarySensorEntityDescription,
     ) -> None:
         """Initialize a Zehnder Cloud binary sensor entity."""
-        super().__init__(coordinator=coordinator)
+        super().__init__(coordinator=coordinator, device_id=device_id)
 
         self.entity_description = description
-        self._attr_unique_id = f"{coordinator.device_id}_{description.key}"
+        self._attr_unique_id = f"{device_id}_{description.key}"
 
     @property
     def is_on(self) -> bool | None:
         """Return true if the binary sensor is on."""
-        return self.entity_description.value_fn(self.coordinator)
+        return self.entity_description.value_fn(self.state_map)
+
+
+def _specialize(
+    description: ZehnderCloudBinarySensorEntityDescription,
+) -> type[ZehnderCloudBinarySensor]:
+    """Return a binary sensor class with the key of the description built in."""
+    if description.value_fn is not None:
+        return ZehnderCloudBinarySensor
+
+    key = description.key
+
+    class ZehnderCloudKeyBinarySensor(ZehnderCloudBinarySensor):
+        """Defines a Zehnder Cloud binary sensor entity for a single value."""
+
+        @property
+        def is_on(self) -> bool | None:
+            """Return true if the binary sensor is on."""
+            return _as_bool(self.state_map[key])
+
+    return ZehnderCloudKeyBinarySensor
+
+
+_SENSOR_CLASSES: tuple[
+    tuple[ZehnderCloudBinarySensorEntityDescription, type[ZehnderCloudBinarySensor]],
+    ...,
+] = tuple((description, _specialize(description)) for description in SENSORS)
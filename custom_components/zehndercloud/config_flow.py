@@ -20,12 +20,8 @@ class ZehnderCloudControlFlowHandler(
 
     DOMAIN = DOMAIN
 
-    def __init__(self) -> None:
-        """Initialize ZehnderCloudControlFlowHandler."""
-        super().__init__()
-
-        # Generate a code_verifier and code_challenge pair to use during OAuth2 flow
-        self.code_verifier, self.code_challenge = pkce.generate_pkce_pair()
+    code_verifier: str | None = None
+    code_challenge: str | None = None
 
     async def async_step_user(
         self, user_input: dict[str, Any] | None = None
@@ -36,6 +32,10 @@ class ZehnderCloudControlFlowHandler(
         if self._async_current_entries():
             return self.async_abort(reason="single_instance_allowed")
 
+        # Generate a code_verifier and code_challenge pair to use during OAuth2 flow
+        if self.code_verifier is None:
+            self.code_verifier, self.code_challenge = pkce.generate_pkce_pair()
+
         self.async_register_implementation(
             self.hass,
             ZehnderCloudOauth2Implementation(self.hass, self.code_verifier),
@@ -67,7 +67,7 @@ class ZehnderCloudControlFlowHandler(
     @property
     def logger(self) -> logging.Logger:
         """Return logger."""
-        return logging.getLogger(__name__)
+        return _LOGGER
 
     @property
     def extra_authorize_data(self) -> dict:
@@ -2,6 +2,9 @@
 
 DOMAIN = "zehndercloud"
 
+CONF_DEVICES = "devices"
+CONF_DISCOVERED_AT = "discovered_at"
+
 OAUTH2_AUTHORIZE = "https://zehndergroupauth.b2clogin.com/zehndergroupauth.onmicrosoft.com/b2c_1_signin_developerportal/oauth2/v2.0/authorize"
 OAUTH2_TOKEN = "https://zehndergroupauth.b2clogin.com/zehndergroupauth.onmicrosoft.com/B2C_1_signin_developerportal/oauth2/v2.0/token"
 # OAUTH2_AUTHORIZE = "https://zehndergroupauth.b2clogin.com/zehndergroupauth.onmicrosoft.com/b2c_1_signin_signup_enduser/oauth2/v2.0/authorize"
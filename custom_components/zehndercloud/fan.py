@@ -9,11 +9,6 @@ from homeassistant.components.fan import FanEntity, FanEntityFeature
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.util.percentage import (
-    int_states_in_range,
-    percentage_to_ranged_value,
-    ranged_value_to_percentage,
-)
 
 from . import ZehnderCloudEntity, ZehnderCloudUpdateCoordinator
 from .const import DOMAIN
@@ -21,6 +16,15 @@ from .const import DOMAIN
 _LOGGER = logging.getLogger(__name__)
 
 SPEED_RANGE = (1, 3)  # away is not included in speeds and instead mapped to off
+SPEED_COUNT = SPEED_RANGE[1] - SPEED_RANGE[0] + 1
+
+# Lookup tables between percentages and speeds, speed 0 (away) is off.
+_PERCENTAGE_TO_SPEED = tuple(
+    math.ceil(percentage * SPEED_COUNT / 100) for percentage in range(101)
+)
+_SPEED_TO_PERCENTAGE = {
+    speed: speed * 100 // SPEED_COUNT for speed in range(SPEED_COUNT + 1)
+}
 
 
 async def async_setup_entry(
@@ -29,11 +33,13 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up Zehnder Cloud fan based on a config entry."""
-    coordinators: list[ZehnderCloudUpdateCoordinator] = hass.data[DOMAIN][
-        entry.entry_id
-    ]
+    coordinator: ZehnderCloudUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
 
-    entities = [ZehnderCloudFan(coordinator) for coordinator in coordinators]
+    # Only devices updated by the first refresh, so that the entities are
+    # registered with their device.
+    entities = [
+        ZehnderCloudFan(coordinator, device_id) for device_id in coordinator.data
+    ]
 
     async_add_entities(entities)
 
@@ -42,27 +48,22 @@ class ZehnderCloudFan(ZehnderCloudEntity, FanEntity):
     """Defines a Zehnder Cloud fan entity."""
 
     _attr_supported_features = FanEntityFeature.SET_SPEED
+    _attr_speed_count = SPEED_COUNT
     current_speed = None
 
     def __init__(
         self,
         coordinator: ZehnderCloudUpdateCoordinator,
+        device_id: int,
     ) -> None:
         """Initialize a Zehnder Cloud fan entity."""
-        super().__init__(coordinator=coordinator)
-        self._attr_unique_id = f"{coordinator.device_id}_fan"
+        super().__init__(coordinator=coordinator, device_id=device_id)
+        self._attr_unique_id = f"{device_id}_fan"
 
     @property
     def percentage(self) -> Optional[int]:
         """Return the current speed percentage."""
-        return ranged_value_to_percentage(
-            SPEED_RANGE, self.coordinator.state.value("ventilationPreset")
-        )
-
-    @property
-    def speed_count(self) -> int:
-        """Return the number of speeds the fan supports."""
-        return int_states_in_range(SPEED_RANGE)
+        return _SPEED_TO_PERCENTAGE.get(self.state_map["ventilationPreset"])
 
     async def async_turn_on(self, percentage=None, preset_mode=None, **kwargs) -> None:
         """Turn the entity on."""
@@ -77,11 +78,11 @@ class ZehnderCloudFan(ZehnderCloudEntity, FanEntity):
 
     async def async_set_percentage(self, percentage: int) -> None:
         """Set fan speed percentage."""
-        speed = math.ceil(percentage_to_ranged_value(SPEED_RANGE, percentage))
+        speed = _PERCENTAGE_TO_SPEED[max(0, min(100, percentage))]
 
         _LOGGER.debug("Changing fan speed percentage to %s -> %d", percentage, speed)
 
         await self.coordinator.client.set_device_settings(
-            self.coordinator.device_id, {"setVentilationPreset": {"value": speed}}
+            self._device_id, {"setVentilationPreset": {"value": speed}}
         )
         await self.coordinator.async_request_refresh()
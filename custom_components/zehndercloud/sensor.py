@@ -3,8 +3,9 @@ from __future__ import annotations
 
 import logging
 from collections.abc import Callable
-from dataclasses import dataclass
-from datetime import datetime
+from dataclasses import dataclass, field
+from itertools import product
+from typing import Any
 
 from homeassistant.components.sensor import (
     SensorDeviceClass,
@@ -14,35 +15,36 @@ from homeassistant.components.sensor import (
 )
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import (
-    ELECTRIC_POTENTIAL_VOLT,
     PERCENTAGE,
-    POWER_WATT,
-    TEMP_CELSIUS,
-    TIME_DAYS,
-    VOLUME_FLOW_RATE_CUBIC_METERS_PER_HOUR,
+    UnitOfElectricPotential,
+    UnitOfPower,
+    UnitOfTemperature,
+    UnitOfTime,
+    UnitOfVolumeFlowRate,
 )
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity import EntityCategory
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.typing import StateType
-from . import ZehnderCloudEntity, ZehnderCloudUpdateCoordinator
+from . import ZehnderCloudEntity, ZehnderCloudUpdateCoordinator, ZehnderCloudValueMap
 from .const import DOMAIN
 
 _LOGGER = logging.getLogger(__name__)
 
 
-@dataclass
-class ZehnderCloudSensorEntityDescriptionMixin:
-    """Mixin for required keys."""
-
-    value_fn: Callable[dict, datetime | StateType]
+@dataclass(frozen=True, kw_only=True)
+class ZehnderCloudSensorEntityDescription(SensorEntityDescription):
+    """Describes Zehnder Cloud sensor entity."""
 
+    # The reported value is converted with `cast` (unless None) and divided by
+    # `divisor`, e.g. temperatures are reported in tenths of a degree.
+    cast: Callable[[Any], StateType] | None = int
+    divisor: int = 1
+    unique_suffix: str = field(init=False, repr=False)
 
-@dataclass
-class ZehnderCloudSensorEntityDescription(
-    SensorEntityDescription, ZehnderCloudSensorEntityDescriptionMixin
-):
-    """Describes Zehnder Cloud sensor entity."""
+    def __post_init__(self) -> None:
+        """Precompute the suffix of the unique id of the sensors."""
+        object.__setattr__(self, "unique_suffix", "_" + self.key)
 
 
 SENSORS: tuple[ZehnderCloudSensorEntityDescription, ...] = (
@@ -53,8 +55,8 @@ SENSORS: tuple[ZehnderCloudSensorEntityDescription, ...] = (
         device_class=SensorDeviceClass.TEMPERATURE,
         state_class=SensorStateClass.MEASUREMENT,
         entity_category=EntityCategory.DIAGNOSTIC,
-        native_unit_of_measurement=TEMP_CELSIUS,
-        value_fn=lambda coordinator: int(coordinator.state.value("exhaustAirTemp")) / 10,
+        native_unit_of_measurement=UnitOfTemperature.CELSIUS,
+        divisor=10,
     ),
     ZehnderCloudSensorEntityDescription(
         key="exhaustAirHumidity",
@@ -63,7 +65,6 @@ SENSORS: tuple[ZehnderCloudSensorEntityDescription, ...] = (
         state_class=SensorStateClass.MEASUREMENT,
         entity_category=EntityCategory.DIAGNOSTIC,
         native_unit_of_measurement=PERCENTAGE,
-        value_fn=lambda coordinator: int(coordinator.state.value("exhaustAirHumidity")),
     ),
     ZehnderCloudSensorEntityDescription(
         key="extractAirTemp",
@@ -71,9 +72,8 @@ SENSORS: tuple[ZehnderCloudSensorEntityDescription, ...] = (
         device_class=SensorDeviceClass.TEMPERATURE,
         state_class=SensorStateClass.MEASUREMENT,
         entity_category=EntityCategory.DIAGNOSTIC,
-        native_unit_of_measurement=TEMP_CELSIUS,
-        value_fn=lambda coordinator: int(coordinator.state.value("extractAirTemp"))
-                                     / 10,
+        native_unit_of_measurement=UnitOfTemperature.CELSIUS,
+        divisor=10,
     ),
     ZehnderCloudSensorEntityDescription(
         key="extractAirHumidity",
@@ -82,7 +82,6 @@ SENSORS: tuple[ZehnderCloudSensorEntityDescription, ...] = (
         state_class=SensorStateClass.MEASUREMENT,
         entity_category=EntityCategory.DIAGNOSTIC,
         native_unit_of_measurement=PERCENTAGE,
-        value_fn=lambda coordinator: int(coordinator.state.value("extractAirHumidity")),
     ),
     ZehnderCloudSensorEntityDescription(
         key="systemOutdoorTemp",
@@ -90,9 +89,8 @@ SENSORS: tuple[ZehnderCloudSensorEntityDescription, ...] = (
         device_class=SensorDeviceClass.TEMPERATURE,
         state_class=SensorStateClass.MEASUREMENT,
         entity_category=EntityCategory.DIAGNOSTIC,
-        native_unit_of_measurement=TEMP_CELSIUS,
-        value_fn=lambda coordinator: int(coordinator.state.value("systemOutdoorTemp"))
-                                     / 10,
+        native_unit_of_measurement=UnitOfTemperature.CELSIUS,
+        divisor=10,
     ),
     ZehnderCloudSensorEntityDescription(
         key="systemOutdoorHumidity",
@@ -101,9 +99,6 @@ SENSORS: tuple[ZehnderCloudSensorEntityDescription, ...] = (
         state_class=SensorStateClass.MEASUREMENT,
         entity_category=EntityCategory.DIAGNOSTIC,
         native_unit_of_measurement=PERCENTAGE,
-        value_fn=lambda coordinator: int(
-            coordinator.state.value("systemOutdoorHumidity")
-        ),
     ),
     ZehnderCloudSensorEntityDescription(
         key="systemSupplyTemp",
@@ -111,9 +106,8 @@ SENSORS: tuple[ZehnderCloudSensorEntityDescription, ...] = (
         device_class=SensorDeviceClass.TEMPERATURE,
         state_class=SensorStateClass.MEASUREMENT,
         entity_category=EntityCategory.DIAGNOSTIC,
-        native_unit_of_measurement=TEMP_CELSIUS,
-        value_fn=lambda coordinator: int(coordinator.state.value("systemSupplyTemp"))
-                                     / 10,
+        native_unit_of_measurement=UnitOfTemperature.CELSIUS,
+        divisor=10,
     ),
     ZehnderCloudSensorEntityDescription(
         key="systemSupplyHumidity",
@@ -122,9 +116,6 @@ SENSORS: tuple[ZehnderCloudSensorEntityDescription, ...] = (
         state_class=SensorStateClass.MEASUREMENT,
         entity_category=EntityCategory.DIAGNOSTIC,
         native_unit_of_measurement=PERCENTAGE,
-        value_fn=lambda coordinator: int(
-            coordinator.state.value("systemSupplyHumidity")
-        ),
     ),
     # Fans
     ZehnderCloudSensorEntityDescription(
@@ -134,7 +125,6 @@ SENSORS: tuple[ZehnderCloudSensorEntityDescription, ...] = (
         state_class=SensorStateClass.MEASUREMENT,
         entity_category=EntityCategory.DIAGNOSTIC,
         native_unit_of_measurement="rpm",
-        value_fn=lambda coordinator: int(coordinator.state.value("exhaustSpeed")),
     ),
     ZehnderCloudSensorEntityDescription(
         key="systemSupplySpeed",
@@ -143,7 +133,6 @@ SENSORS: tuple[ZehnderCloudSensorEntityDescription, ...] = (
         state_class=SensorStateClass.MEASUREMENT,
         entity_category=EntityCategory.DIAGNOSTIC,
         native_unit_of_measurement="rpm",
-        value_fn=lambda coordinator: int(coordinator.state.value("systemSupplySpeed")),
     ),
     ZehnderCloudSensorEntityDescription(
         key="exhaustDuty",
@@ -152,7 +141,6 @@ SENSORS: tuple[ZehnderCloudSensorEntityDescription, ...] = (
         state_class=SensorStateClass.MEASUREMENT,
         entity_category=EntityCategory.DIAGNOSTIC,
         native_unit_of_measurement=PERCENTAGE,
-        value_fn=lambda coordinator: int(coordinator.state.value("exhaustDuty")),
     ),
     ZehnderCloudSensorEntityDescription(
         key="systemSupplyDuty",
@@ -161,7 +149,6 @@ SENSORS: tuple[ZehnderCloudSensorEntityDescription, ...] = (
         state_class=SensorStateClass.MEASUREMENT,
         entity_category=EntityCategory.DIAGNOSTIC,
         native_unit_of_measurement=PERCENTAGE,
-        value_fn=lambda coordinator: int(coordinator.state.value("systemSupplyDuty")),
     ),
     ZehnderCloudSensorEntityDescription(
         key="exhaustFanAirFlow",
@@ -169,8 +156,7 @@ SENSORS: tuple[ZehnderCloudSensorEntityDescription, ...] = (
         device_class=None,
         state_class=SensorStateClass.MEASUREMENT,
         entity_category=EntityCategory.DIAGNOSTIC,
-        native_unit_of_measurement=VOLUME_FLOW_RATE_CUBIC_METERS_PER_HOUR,
-        value_fn=lambda coordinator: int(coordinator.state.value("exhaustFanAirFlow")),
+        native_unit_of_measurement=UnitOfVolumeFlowRate.CUBIC_METERS_PER_HOUR,
     ),
     ZehnderCloudSensorEntityDescription(
         key="supplyFanAirFlow",
@@ -178,8 +164,7 @@ SENSORS: tuple[ZehnderCloudSensorEntityDescription, ...] = (
         device_class=None,
         state_class=SensorStateClass.MEASUREMENT,
         entity_category=EntityCategory.DIAGNOSTIC,
-        native_unit_of_measurement=VOLUME_FLOW_RATE_CUBIC_METERS_PER_HOUR,
-        value_fn=lambda coordinator: int(coordinator.state.value("supplyFanAirFlow")),
+        native_unit_of_measurement=UnitOfVolumeFlowRate.CUBIC_METERS_PER_HOUR,
     ),
     # Power Consumption
     ZehnderCloudSensorEntityDescription(
@@ -188,10 +173,7 @@ SENSORS: tuple[ZehnderCloudSensorEntityDescription, ...] = (
         device_class=SensorDeviceClass.POWER,
         state_class=SensorStateClass.MEASUREMENT,
         entity_category=EntityCategory.DIAGNOSTIC,
-        native_unit_of_measurement=POWER_WATT,
-        value_fn=lambda coordinator: int(
-            coordinator.state.value("currentVentilationPower")
-        ),
+        native_unit_of_measurement=UnitOfPower.WATT,
     ),
     # Analog Input
     ZehnderCloudSensorEntityDescription(
@@ -201,8 +183,8 @@ SENSORS: tuple[ZehnderCloudSensorEntityDescription, ...] = (
         state_class=SensorStateClass.MEASUREMENT,
         entity_category=EntityCategory.DIAGNOSTIC,
         entity_registry_enabled_default=False,
-        native_unit_of_measurement=ELECTRIC_POTENTIAL_VOLT,
-        value_fn=lambda coordinator: coordinator.state.value("analogInput1"),
+        native_unit_of_measurement=UnitOfElectricPotential.VOLT,
+        cast=None,
     ),
     ZehnderCloudSensorEntityDescription(
         key="analogInput2",
@@ -211,8 +193,8 @@ SENSORS: tuple[ZehnderCloudSensorEntityDescription, ...] = (
         state_class=SensorStateClass.MEASUREMENT,
         entity_category=EntityCategory.DIAGNOSTIC,
         entity_registry_enabled_default=False,
-        native_unit_of_measurement=ELECTRIC_POTENTIAL_VOLT,
-        value_fn=lambda coordinator: coordinator.state.value("analogInput2"),
+        native_unit_of_measurement=UnitOfElectricPotential.VOLT,
+        cast=None,
     ),
     ZehnderCloudSensorEntityDescription(
         key="analogInput3",
@@ -221,8 +203,8 @@ SENSORS: tuple[ZehnderCloudSensorEntityDescription, ...] = (
         state_class=SensorStateClass.MEASUREMENT,
         entity_category=EntityCategory.DIAGNOSTIC,
         entity_registry_enabled_default=False,
-        native_unit_of_measurement=ELECTRIC_POTENTIAL_VOLT,
-        value_fn=lambda coordinator: coordinator.state.value("analogInput3"),
+        native_unit_of_measurement=UnitOfElectricPotential.VOLT,
+        cast=None,
     ),
     ZehnderCloudSensorEntityDescription(
         key="analogInput4",
@@ -231,8 +213,8 @@ SENSORS: tuple[ZehnderCloudSensorEntityDescription, ...] = (
         state_class=SensorStateClass.MEASUREMENT,
         entity_category=EntityCategory.DIAGNOSTIC,
         entity_registry_enabled_default=False,
-        native_unit_of_measurement=ELECTRIC_POTENTIAL_VOLT,
-        value_fn=lambda coordinator: coordinator.state.value("analogInput4"),
+        native_unit_of_measurement=UnitOfElectricPotential.VOLT,
+        cast=None,
     ),
     # Bypass
     ZehnderCloudSensorEntityDescription(
@@ -243,7 +225,7 @@ SENSORS: tuple[ZehnderCloudSensorEntityDescription, ...] = (
         state_class=SensorStateClass.MEASUREMENT,
         entity_category=EntityCategory.DIAGNOSTIC,
         native_unit_of_measurement=PERCENTAGE,
-        value_fn=lambda coordinator: coordinator.state.value("bypassDuty"),
+        cast=None,
         icon="mdi:camera-iris",
     ),
     ZehnderCloudSensorEntityDescription(
@@ -254,7 +236,7 @@ SENSORS: tuple[ZehnderCloudSensorEntityDescription, ...] = (
         state_class=SensorStateClass.MEASUREMENT,
         entity_category=EntityCategory.DIAGNOSTIC,
         # native_unit_of_measurement=ELECTRIC_POTENTIAL_VOLT,
-        value_fn=lambda coordinator: coordinator.state.value("bypassMode"),
+        cast=None,
     ),
     # ventilationMode
     ZehnderCloudSensorEntityDescription(
@@ -265,7 +247,7 @@ SENSORS: tuple[ZehnderCloudSensorEntityDescription, ...] = (
         state_class=SensorStateClass.MEASUREMENT,
         entity_category=EntityCategory.DIAGNOSTIC,
         # native_unit_of_measurement=ELECTRIC_POTENTIAL_VOLT,
-        value_fn=lambda coordinator: coordinator.state.value("ventilationMode"),
+        cast=None,
     ),
     ZehnderCloudSensorEntityDescription(
         # The ventilation pre-set the unit is currently running at.
@@ -275,7 +257,7 @@ SENSORS: tuple[ZehnderCloudSensorEntityDescription, ...] = (
         state_class=SensorStateClass.MEASUREMENT,
         entity_category=EntityCategory.DIAGNOSTIC,
         # native_unit_of_measurement=ELECTRIC_POTENTIAL_VOLT,
-        value_fn=lambda coordinator: coordinator.state.value("ventilationPreset"),
+        cast=None,
     ),
     # Other
     ZehnderCloudSensorEntityDescription(
@@ -284,10 +266,7 @@ SENSORS: tuple[ZehnderCloudSensorEntityDescription, ...] = (
         # device_class=None,
         # state_class=SensorStateClass.MEASUREMENT,
         entity_category=EntityCategory.DIAGNOSTIC,
-        native_unit_of_measurement=TIME_DAYS,
-        value_fn=lambda coordinator: int(
-            coordinator.state.value("remainingFilterDuration")
-        ),
+        native_unit_of_measurement=UnitOfTime.DAYS,
         icon="mdi:calendar",
     ),
 )
@@ -299,17 +278,14 @@ async def async_setup_entry(
         async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up Zehnder Cloud sensor based on a config entry."""
-    coordinators: list[ZehnderCloudUpdateCoordinator] = hass.data[DOMAIN][
-        entry.entry_id
-    ]
-
-    entities = [
-        ZehnderCloudSensor(coordinator, description)
-        for description in SENSORS
-        for coordinator in coordinators
-    ]
+    coordinator: ZehnderCloudUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
 
-    async_add_entities(entities)
+    # Only devices updated by the first refresh, so that the entities are
+    # registered with their device.
+    async_add_entities(
+        ZehnderCloudSensor(coordinator, device_id, description)
+        for description, device_id in product(SENSORS, coordinator.data)
+    )
 
 
 class ZehnderCloudSensor(ZehnderCloudEntity, SensorEntity):
@@ -317,17 +293,41 @@ class ZehnderCloudSensor(ZehnderCloudEntity, SensorEntity):
 
     entity_description: ZehnderCloudSensorEntityDescription
 
+    __slots__ = ("_key", "_cast", "_divisor", "_cached_map", "_cached_value")
+
     def __init__(
             self,
             coordinator: ZehnderCloudUpdateCoordinator,
+            device_id: int,
             description: ZehnderCloudSensorEntityDescription,
     ) -> None:
         """Initialize a Zehnder Cloud sensor entity."""
-        super().__init__(coordinator=coordinator)
+        super().__init__(coordinator=coordinator, device_id=device_id)
         self.entity_description = description
-        self._attr_unique_id = f"{coordinator.device_id}_{description.key}"
+        self._attr_unique_id = str(device_id) + description.unique_suffix
+
+        # Bound here so reading the state skips the entity description.
+        self._key = description.key
+        self._cast = description.cast
+        self._divisor = description.divisor
+        self._cached_map: ZehnderCloudValueMap | None = None
+        self._cached_value: StateType = None
 
     @property
-    def native_value(self) -> datetime | StateType:
+    def native_value(self) -> StateType:
         """Return the state of the sensor."""
-        return self.entity_description.value_fn(self.coordinator)
+        # The coordinator creates a new state map whenever the device reports
+        # a new sample, so the converted value is reused until that happens.
+        state_map = self.state_map
+        if state_map is self._cached_map:
+            return self._cached_value
+
+        value = state_map[self._key]
+        if self._cast is not None:
+            value = self._cast(value)
+        if self._divisor != 1:
+            value /= self._divisor
+
+        self._cached_map = state_map
+        self._cached_value = value
+        return value